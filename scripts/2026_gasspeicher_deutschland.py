@@ -3,26 +3,43 @@
 
 Features:
 - Download `url_b` from BNetzA and cache it in `data/bnetza_cache.csv`.
+- Revalidate the cache with `ETag`/`Last-Modified` stored in a sidecar JSON file.
 - Fall back to cache if the download fails.
 - Compute scenario projections from the latest rolling window (default 30 days).
 - Append one machine-readable row per execution to `data/projections.csv`.
+- Skip the run if the source is unchanged and today's projection already exists.
 """
 
 from __future__ import annotations
 
 import argparse
+import csv
 import datetime as dt
+import functools
+import hashlib
 import io
+import json
+import mmap
+import os
+import re
 import sys
 import unicodedata
-from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Tuple
-
-import pandas as pd
-import requests
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes stay atomic via os.replace.
+    fcntl = None
+
+# pandas, numpy, pyarrow and requests are imported where they are used so that
+# `--help` and no-op runs do not pay for loading them.
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import requests
+
 URL_A = (
     "https://www.bundesnetzagentur.de/_tools/SVG/js2/_functions/"
     "csv_export.html?view=renderCSV&id=870304"
@@ -32,64 +49,110 @@ URL_B = (
     "csv_export.html?view=renderCSV&id=870306"
 )
 
-SCENARIOS = OrderedDict(
-    [
-        ("optimistic_20pct_lower_withdrawal", "Optimistisch (20% weniger Entnahme)"),
-        ("smallest_withdrawal", "Kleinste Entnahme"),
-        ("average_withdrawal", "Durchschnittliche Entnahme"),
-        ("largest_withdrawal", "Groesste Entnahme"),
-        ("pessimistic_20pct_higher_withdrawal", "Pessimistisch (20% mehr Entnahme)"),
-    ]
+SCENARIOS = (
+    ("optimistic_20pct_lower_withdrawal", "Optimistisch (20% weniger Entnahme)"),
+    ("smallest_withdrawal", "Kleinste Entnahme"),
+    ("average_withdrawal", "Durchschnittliche Entnahme"),
+    ("largest_withdrawal", "Groesste Entnahme"),
+    ("pessimistic_20pct_higher_withdrawal", "Pessimistisch (20% mehr Entnahme)"),
 )
+_SCENARIO_KEYS = tuple(key for key, _ in SCENARIOS)
+
+# ASCII folding for the characters that occur in BNetzA headers.
+_FOLD = str.maketrans(
+    {"ä": "a", "ö": "o", "ü": "u", "Ä": "a", "Ö": "o", "Ü": "u", "ß": "ss", "%": "pct"}
+)
+
+# Matched against normalize_column() output; the lookaheads accept either word order
+# ("veranderung_zum_vortag" as well as "vortag_veranderung").
+_FILL_RE = re.compile(r"^fullstand|fill")
+_DELTA_RE = re.compile(r"^(?=.*vortag)(?=.*anderung)|^(?=.*previous)(?=.*change)")
+
+_BERLIN_TZ = ZoneInfo("Europe/Berlin")
 
 PROJECTION_SECTION_HEADING = "## Letzte Projektionen"
 DEFAULT_README_PATH = Path(__file__).resolve().parents[1] / "README.md"
 
 
+@functools.lru_cache(maxsize=1)
+def http_session() -> requests.Session:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
+@functools.lru_cache(maxsize=128)
 def normalize_column(name: str) -> str:
-    normalized = unicodedata.normalize("NFKD", str(name))
-    ascii_name = normalized.encode("ascii", "ignore").decode("ascii")
-    ascii_name = ascii_name.lower().replace("%", "pct")
-    return "_".join(ascii_name.split())
+    folded = str(name).translate(_FOLD).lower()
+    if not folded.isascii():
+        # Characters outside the BNetzA set still go through the NFKD path.
+        folded = unicodedata.normalize("NFKD", folded).encode("ascii", "ignore").decode("ascii")
+    return "_".join(folded.split())
 
 
 def parse_bnetza_csv(csv_text: str) -> pd.DataFrame:
-    frame = pd.read_csv(io.StringIO(csv_text), sep=";", decimal=",")
-    if frame.empty:
-        raise ValueError("CSV is empty.")
-
-    frame = frame.copy()
-    frame.rename(columns={frame.columns[0]: "day"}, inplace=True)
-    frame["day"] = pd.to_datetime(frame["day"], dayfirst=True, errors="coerce")
-    frame.dropna(subset=["day"], inplace=True)
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
 
-    col_map = {normalize_column(col): col for col in frame.columns}
+    # Detect the columns from the header line first so only these three are parsed.
+    header = next(csv.reader(io.StringIO(csv_text.lstrip("\ufeff")), delimiter=";"), [])
+    if not header:
+        raise ValueError("CSV is empty.")
 
-    fill_col = None
-    for key, original in col_map.items():
-        if key.startswith("fullstand") or "fill" in key:
-            fill_col = original
-            break
+    day_col = header[0]
+    col_map = {normalize_column(col): col for col in header[1:]}
 
-    delta_col = None
-    for key, original in col_map.items():
-        if "vortag" in key and ("veranderung" in key or "anderung" in key):
-            delta_col = original
-            break
-        if "previous" in key and "change" in key:
-            delta_col = original
-            break
+    fill_col = next((orig for key, orig in col_map.items() if _FILL_RE.search(key)), None)
+    delta_col = next((orig for key, orig in col_map.items() if _DELTA_RE.search(key)), None)
 
     if fill_col is None or delta_col is None:
         raise ValueError(
             "Required columns not found in CSV. Needed fill level and daily change columns."
         )
 
-    prepared = frame[["day", fill_col, delta_col]].copy()
-    prepared.rename(
-        columns={fill_col: "fill_level_pct", delta_col: "delta_pct_per_day"},
-        inplace=True,
-    )
+    csv_bytes = csv_text.encode("utf-8")
+
+    def read_table(column_types: Dict[str, object]) -> pa.Table:
+        return pacsv.read_csv(
+            pa.BufferReader(csv_bytes),
+            # Short or ragged rows (e.g. a "Quelle: ..." footer) are dropped, as pandas did.
+            parse_options=pacsv.ParseOptions(delimiter=";", invalid_row_handler=lambda row: "skip"),
+            convert_options=pacsv.ConvertOptions(
+                decimal_point=",",
+                include_columns=[day_col, fill_col, delta_col],
+                column_types=column_types,
+            ),
+        )
+
+    try:
+        table = read_table(
+            {day_col: pa.string(), fill_col: pa.float64(), delta_col: pa.float64()}
+        )
+    except pa.ArrowInvalid as exc:
+        # Ragged rows are skipped above, so only a failed float conversion is retried:
+        # let Arrow infer the types and coerce non-numeric cells to NaN below.
+        if "conversion error" not in str(exc):
+            raise
+        table = read_table({day_col: pa.string()})
+
+    prepared = table.to_pandas()
+    if prepared.empty:
+        raise ValueError("CSV is empty.")
+
+    prepared.columns = ["day", "fill_level_pct", "delta_pct_per_day"]
+    prepared["day"] = pd.to_datetime(prepared["day"], format="%d.%m.%Y", errors="coerce")
+    prepared.dropna(subset=["day"], inplace=True)
     prepared["fill_level_pct"] = pd.to_numeric(prepared["fill_level_pct"], errors="coerce")
     prepared["delta_pct_per_day"] = pd.to_numeric(
         prepared["delta_pct_per_day"], errors="coerce"
@@ -100,17 +163,90 @@ def parse_bnetza_csv(csv_text: str) -> pd.DataFrame:
     return prepared
 
 
+def cache_meta_path(cache_path: Path) -> Path:
+    return cache_path.with_suffix(".meta.json")
+
+
+def read_cache_meta(cache_path: Path) -> Dict[str, object]:
+    meta_path = cache_meta_path(cache_path)
+    if not meta_path.exists():
+        return {}
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        print(f"[WARN] Ignoring unreadable cache metadata {meta_path}: {exc}", file=sys.stderr)
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def write_cache_meta(cache_path: Path, updates: Dict[str, object]) -> None:
+    meta = read_cache_meta(cache_path)
+    for key, value in updates.items():
+        if value is None:
+            meta.pop(key, None)
+        else:
+            meta[key] = value
+    cache_meta_path(cache_path).write_text(
+        json.dumps(meta, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def read_cache_text(cache_path: Path) -> str:
+    # Decode the raw bytes so the text matches what the network path returned.
+    return cache_path.read_bytes().decode("utf-8")
+
+
+def csv_digest(csv_text: str) -> str:
+    return hashlib.blake2b(csv_text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def has_projection_for(
+    projections_path: Path, run_date_berlin: str, minimum_pct: float, lookback_days: int
+) -> bool:
+    if not projections_path.exists():
+        return False
+    with projections_path.open(encoding="utf-8", newline="") as handle:
+        for record in csv.DictReader(handle):
+            try:
+                if (
+                    record.get("run_date_berlin") == run_date_berlin
+                    and int(record["lookback_days"]) == lookback_days
+                    and float(record["minimum_threshold_pct"]) == minimum_pct
+                ):
+                    return True
+            except (KeyError, TypeError, ValueError):
+                continue
+    return False
+
+
 def fetch_url_b_with_cache(url: str, cache_path: Path, timeout_seconds: int = 20) -> Tuple[str, str]:
     cache_path.parent.mkdir(parents=True, exist_ok=True)
+    headers: Dict[str, str] = {"Accept-Encoding": "gzip, deflate"}
+    if cache_path.exists():
+        meta = read_cache_meta(cache_path)
+        if meta.get("etag"):
+            headers["If-None-Match"] = str(meta["etag"])
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = str(meta["last_modified"])
+
     try:
-        response = requests.get(url, timeout=timeout_seconds)
+        response = http_session().get(url, headers=headers, timeout=timeout_seconds)
+        if response.status_code == 304:
+            return read_cache_text(cache_path), "cache-304"
         response.raise_for_status()
         csv_text = response.text
         cache_path.write_text(csv_text, encoding="utf-8")
+        write_cache_meta(
+            cache_path,
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            },
+        )
         return csv_text, "network"
     except Exception as exc:
         if cache_path.exists():
-            csv_text = cache_path.read_text(encoding="utf-8")
+            csv_text = read_cache_text(cache_path)
             print(f"[WARN] Network fetch failed, using cache: {exc}", file=sys.stderr)
             return csv_text, "cache"
         raise RuntimeError(
@@ -118,16 +254,46 @@ def fetch_url_b_with_cache(url: str, cache_path: Path, timeout_seconds: int = 20
         ) from exc
 
 
+def compute_window_rates(
+    delta_arr: np.ndarray, windows: list[int]
+) -> Dict[int, Tuple[float, float, float]]:
+    # (min, max, mean) of the latest `window` daily changes, NaNs ignored. Each window
+    # is a slice (a view, no copy) of the shared tail, so it costs O(window).
+    import numpy as np
+
+    if not windows or min(windows) <= 0:
+        raise ValueError("Lookback windows must be positive.")
+
+    recent = np.asarray(delta_arr, dtype=np.float64)[-max(windows):]
+    if recent.size == 0:
+        raise ValueError("No rows available in requested lookback window.")
+
+    rates: Dict[int, Tuple[float, float, float]] = {}
+    for window in windows:
+        latest = recent[-window:]
+        if np.isnan(latest).all():
+            raise ValueError("No daily change values available to compute projections.")
+        rates[window] = (
+            float(np.nanmin(latest)),
+            float(np.nanmax(latest)),
+            float(np.nanmean(latest)),
+        )
+    return rates
+
+
 def build_projection_row(
     delta_frame: pd.DataFrame,
     minimum_pct: float,
     lookback_days: int,
     source_mode: str,
 ) -> Dict[str, object]:
+    import numpy as np
+    import pandas as pd
+
     if delta_frame.empty:
         raise ValueError("No usable rows found after parsing.")
 
-    windowed = delta_frame.tail(lookback_days).copy()
+    windowed = delta_frame.tail(lookback_days)
     if windowed.empty:
         raise ValueError("No rows available in requested lookback window.")
 
@@ -135,28 +301,20 @@ def build_projection_row(
     last_date = pd.Timestamp(last["day"])
     current_level = float(last["fill_level_pct"])
 
-    rates = windowed["delta_pct_per_day"].dropna()
-    if rates.empty:
-        raise ValueError("No daily change values available to compute projections.")
-
-    rate_min = float(rates.min())
-    rate_max = float(rates.max())
-    rate_avg = float(rates.mean())
+    delta_arr = delta_frame["delta_pct_per_day"].to_numpy(dtype=np.float64, copy=False)
+    rate_min, rate_max, rate_avg = compute_window_rates(delta_arr, [lookback_days])[lookback_days]
     rate_min_20 = rate_min - abs(rate_min) * 0.2
     rate_max_20 = rate_max + abs(rate_max) * 0.2
 
-    scenario_rates = OrderedDict(
-        [
-            ("optimistic_20pct_lower_withdrawal", rate_max_20),
-            ("smallest_withdrawal", rate_max),
-            ("average_withdrawal", rate_avg),
-            ("largest_withdrawal", rate_min),
-            ("pessimistic_20pct_higher_withdrawal", rate_min_20),
-        ]
-    )
+    # Same order as _SCENARIO_KEYS; only negative rates ever reach the minimum.
+    rates = np.array([rate_max_20, rate_max, rate_avg, rate_min, rate_min_20])
+    withdrawing = rates < 0
+    days = np.full_like(rates, np.nan)
+    np.divide(current_level - minimum_pct, np.abs(rates), out=days, where=withdrawing)
+    days = np.maximum(days, 0.0)
 
     now_utc = dt.datetime.now(dt.timezone.utc)
-    now_berlin = now_utc.astimezone(ZoneInfo("Europe/Berlin"))
+    now_berlin = now_utc.astimezone(_BERLIN_TZ)
 
     row: Dict[str, object] = {
         "run_timestamp_utc": now_utc.isoformat(),
@@ -173,19 +331,21 @@ def build_projection_row(
         "rate_max_pct_per_day": round(rate_max, 6),
     }
 
-    for scenario_key, rate in scenario_rates.items():
+    last_dt = last_date.to_pydatetime()
+    for scenario_key, rate, is_withdrawing, days_to_min in zip(
+        _SCENARIO_KEYS, rates.tolist(), withdrawing.tolist(), days.tolist()
+    ):
         rate_col = f"{scenario_key}_rate_pct_per_day"
         target_col = f"{scenario_key}_target_date"
         days_col = f"{scenario_key}_days_to_min"
 
-        row[rate_col] = round(float(rate), 6)
-        if rate >= 0:
+        row[rate_col] = round(rate, 6)
+        if not is_withdrawing:
             row[target_col] = ""
             row[days_col] = ""
             continue
 
-        days_to_min = max((current_level - minimum_pct) / abs(rate), 0.0)
-        target_date = (last_date + pd.to_timedelta(days_to_min, unit="D")).date()
+        target_date = (last_dt + dt.timedelta(days=days_to_min)).date()
         row[target_col] = target_date.isoformat()
         row[days_col] = round(days_to_min, 3)
 
@@ -194,21 +354,52 @@ def build_projection_row(
 
 def append_projection_row(projections_path: Path, row: Dict[str, object]) -> None:
     projections_path.parent.mkdir(parents=True, exist_ok=True)
-    row_frame = pd.DataFrame([row])
+    lock_path = projections_path.with_name(f".{projections_path.stem}.lock")
+    with lock_path.open("w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        _append_projection_row_locked(projections_path, row)
+
+
+def _append_projection_row_locked(projections_path: Path, row: Dict[str, object]) -> None:
+    fieldnames = list(row.keys())
+    tmp_path = projections_path.with_name(f"{projections_path.name}.tmp")
+
+    if not projections_path.exists() or projections_path.stat().st_size == 0:
+        with tmp_path.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=fieldnames, lineterminator="\n")
+            writer.writeheader()
+            writer.writerow(row)
+        os.replace(tmp_path, projections_path)
+        return
+
+    with projections_path.open(encoding="utf-8", newline="") as handle:
+        header = next(csv.reader(handle), [])
+
+    if header == fieldnames:
+        with projections_path.open("rb") as handle:
+            handle.seek(-1, io.SEEK_END)
+            needs_newline = handle.read(1) != b"\n"
+        with projections_path.open("a", encoding="utf-8", newline="") as handle:
+            if needs_newline:
+                handle.write("\n")
+            csv.DictWriter(handle, fieldnames=fieldnames, lineterminator="\n").writerow(row)
+        return
 
-    if projections_path.exists() and projections_path.stat().st_size > 0:
-        existing = pd.read_csv(projections_path)
-        for column in existing.columns:
-            if column not in row_frame.columns:
-                row_frame[column] = ""
-        for column in row_frame.columns:
-            if column not in existing.columns:
-                existing[column] = ""
-        merged = pd.concat([existing, row_frame[existing.columns]], ignore_index=True)
-    else:
-        merged = row_frame
+    # Schema changed: merge old and new columns and rewrite the whole history.
+    import pandas as pd
 
-    merged.to_csv(projections_path, index=False)
+    row_frame = pd.DataFrame([row])
+    existing = pd.read_csv(projections_path)
+    for column in existing.columns:
+        if column not in row_frame.columns:
+            row_frame[column] = ""
+    for column in row_frame.columns:
+        if column not in existing.columns:
+            existing[column] = ""
+    merged = pd.concat([existing, row_frame[existing.columns]], ignore_index=True)
+    merged.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, projections_path)
 
 
 def print_console_summary(row: Dict[str, object]) -> None:
@@ -221,7 +412,7 @@ def print_console_summary(row: Dict[str, object]) -> None:
     print()
     print("Szenarien - Minimum wird erreicht am:")
 
-    for scenario_key, scenario_label in SCENARIOS.items():
+    for scenario_key, scenario_label in SCENARIOS:
         target_col = f"{scenario_key}_target_date"
         rate_col = f"{scenario_key}_rate_pct_per_day"
         days_col = f"{scenario_key}_days_to_min"
@@ -260,7 +451,7 @@ def build_projection_block_lines(row: Dict[str, object]) -> list[str]:
         "",
     ]
 
-    for scenario_key, scenario_label in SCENARIOS.items():
+    for scenario_key, scenario_label in SCENARIOS:
         target_col = f"{scenario_key}_target_date"
         rate_col = f"{scenario_key}_rate_pct_per_day"
         target_date = row[target_col] if row[target_col] else "nicht erreicht (nicht-negative Rate)"
@@ -280,13 +471,32 @@ def build_projection_block_lines(row: Dict[str, object]) -> list[str]:
     return lines
 
 
-def update_readme_projection(readme_path: Path, row: Dict[str, object]) -> None:
-    if not readme_path.exists():
-        print(f"[WARN] README not found at {readme_path}; skipping README update.", file=sys.stderr)
-        return
-
-    readme_lines = readme_path.read_text(encoding="utf-8").splitlines()
-
+def readme_block_signature(readme_lines: list[str], start_idx: int, end_idx: int) -> str:
+    # Hash the four lines on either side of the block, which stay put between runs.
+    context = readme_lines[max(start_idx - 4, 0) : start_idx] + readme_lines[end_idx + 1 : end_idx + 5]
+    return hashlib.blake2b("\n".join(context).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cached_readme_block(
+    readme_lines: list[str], cache_path: Optional[Path]
+) -> Optional[Tuple[int, int]]:
+    if cache_path is None:
+        return None
+    meta = read_cache_meta(cache_path)
+    start_idx = meta.get("readme_block_start")
+    end_idx = meta.get("readme_block_end")
+    if not isinstance(start_idx, int) or not isinstance(end_idx, int):
+        return None
+    if not 0 <= start_idx < end_idx < len(readme_lines):
+        return None
+    if readme_lines[start_idx].strip() != "```text" or readme_lines[end_idx].strip() != "```":
+        return None
+    if meta.get("readme_sig") != readme_block_signature(readme_lines, start_idx, end_idx):
+        return None
+    return start_idx, end_idx
+
+
+def find_readme_block(readme_lines: list[str]) -> Optional[Tuple[int, int]]:
     heading_idx = None
     for idx, line in enumerate(readme_lines):
         if line.strip() == PROJECTION_SECTION_HEADING:
@@ -298,7 +508,7 @@ def update_readme_projection(readme_path: Path, row: Dict[str, object]) -> None:
             f"[WARN] Heading '{PROJECTION_SECTION_HEADING}' not found; skipping README update.",
             file=sys.stderr,
         )
-        return
+        return None
 
     start_idx = None
     end_idx = None
@@ -309,7 +519,7 @@ def update_readme_projection(readme_path: Path, row: Dict[str, object]) -> None:
 
     if start_idx is None:
         print("[WARN] Projection code block start not found; skipping README update.", file=sys.stderr)
-        return
+        return None
 
     for idx in range(start_idx + 1, len(readme_lines)):
         if readme_lines[idx].strip() == "```":
@@ -318,11 +528,60 @@ def update_readme_projection(readme_path: Path, row: Dict[str, object]) -> None:
 
     if end_idx is None:
         print("[WARN] Projection code block end not found; skipping README update.", file=sys.stderr)
+        return None
+
+    return start_idx, end_idx
+
+
+def update_readme_projection(
+    readme_path: Path, row: Dict[str, object], cache_path: Optional[Path] = None
+) -> None:
+    if not readme_path.exists():
+        print(f"[WARN] README not found at {readme_path}; skipping README update.", file=sys.stderr)
+        return
+    if readme_path.stat().st_size == 0:
+        print(f"[WARN] README at {readme_path} is empty; skipping README update.", file=sys.stderr)
         return
 
     new_block = build_projection_block_lines(row)
-    updated = readme_lines[:start_idx] + new_block + readme_lines[end_idx + 1 :]
-    readme_path.write_text("\n".join(updated) + "\n", encoding="utf-8")
+    with readme_path.open("r+b") as handle, mmap.mmap(handle.fileno(), 0) as mm:
+        readme_text = mm[:].decode("utf-8")
+        readme_lines = readme_text.splitlines()
+
+        block = cached_readme_block(readme_lines, cache_path)
+        if block is None:
+            block = find_readme_block(readme_lines)
+            if block is None:
+                return
+        start_idx, end_idx = block
+
+        # Byte range of the old block, from its opening fence up to (not including)
+        # the line break after its closing fence.
+        raw_lines = readme_text.splitlines(keepends=True)
+        start_byte = len("".join(raw_lines[:start_idx]).encode("utf-8"))
+        old_block = "".join(raw_lines[start_idx:end_idx]) + readme_lines[end_idx]
+        end_byte = start_byte + len(old_block.encode("utf-8"))
+        new_block_bytes = "\n".join(new_block).encode("utf-8")
+
+        rewritten_in_place = len(new_block_bytes) == end_byte - start_byte
+        if rewritten_in_place and mm[start_byte:end_byte] != new_block_bytes:
+            mm[start_byte:end_byte] = new_block_bytes
+            mm.flush()
+
+    if not rewritten_in_place:
+        updated = readme_lines[:start_idx] + new_block + readme_lines[end_idx + 1 :]
+        readme_path.write_text("\n".join(updated) + "\n", encoding="utf-8")
+
+    if cache_path is not None:
+        write_cache_meta(
+            cache_path,
+            {
+                "readme_block_start": start_idx,
+                "readme_block_end": start_idx + len(new_block) - 1,
+                # The context lines around the block are the same before and after.
+                "readme_sig": readme_block_signature(readme_lines, start_idx, end_idx),
+            },
+        )
 
 
 def parse_args() -> argparse.Namespace:
@@ -379,17 +638,33 @@ def main() -> int:
     cache_path = data_dir / args.cache_file
     projections_path = data_dir / args.projections_file
 
+    minimum_pct = float(args.minimum)
+    lookback_days = int(args.lookback_days)
+
     csv_text, source_mode = fetch_url_b_with_cache(URL_B, cache_path=cache_path)
+    digest = csv_digest(csv_text)
+    run_date_berlin = dt.datetime.now(dt.timezone.utc).astimezone(_BERLIN_TZ).date().isoformat()
+    if read_cache_meta(cache_path).get("digest") == digest and has_projection_for(
+        projections_path, run_date_berlin, minimum_pct, lookback_days
+    ):
+        print(
+            f"Quelle unveraendert (Datenquelle: {source_mode}) und Projektion vom "
+            f"{run_date_berlin} bereits vorhanden; nichts zu tun."
+        )
+        print(f"Ergebnis-Datei: {projections_path}")
+        return 0
+
     delta_frame = parse_bnetza_csv(csv_text)
     row = build_projection_row(
         delta_frame=delta_frame,
-        minimum_pct=float(args.minimum),
-        lookback_days=int(args.lookback_days),
+        minimum_pct=minimum_pct,
+        lookback_days=lookback_days,
         source_mode=source_mode,
     )
     append_projection_row(projections_path, row)
     if not args.skip_readme_update:
-        update_readme_projection(args.readme_file, row)
+        update_readme_projection(args.readme_file, row, cache_path=cache_path)
+    write_cache_meta(cache_path, {"digest": digest})
     print_console_summary(row)
     print(f"\nErgebnis geschrieben nach: {projections_path}")
     print(f"Cache-Datei: {cache_path}")